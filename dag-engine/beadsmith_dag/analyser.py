@@ -1,6 +1,7 @@
 """Main project analyser coordinating all analysis components."""
 
 import time
+from dataclasses import asdict
 from pathlib import Path
 
 import networkx as nx
@@ -217,8 +218,8 @@ class ProjectAnalyser:
             nodes, edges = [], []
 
         return {
-            "nodes": [n.model_dump() for n in nodes],
-            "edges": [e.model_dump() for e in edges],
+            "nodes": [asdict(n) for n in nodes],
+            "edges": [asdict(e) for e in edges],
             "warnings": [w.model_dump() for w in warnings],
         }
 
@@ -1,6 +1,7 @@
 """Graph building and querying utilities."""
 
 from .builder import GraphBuilder
+from .cached import CachedDiGraph
 from .queries import GraphQueries
 
-__all__ = ["GraphBuilder", "GraphQueries"]
+__all__ = ["CachedDiGraph", "GraphBuilder", "GraphQueries"]
@@ -1,14 +1,190 @@
 """Build NetworkX graph from parsed nodes and edges."""
 
+from array import array
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from sys import intern
+
 import networkx as nx
 
-from ..models import GraphEdge, GraphNode
+from ..models import EdgeConfidence, EdgeType, GraphEdge, GraphNode, NodeType
+from .cached import CachedDiGraph, LazyPredDiGraph
+
+try:
+    import numpy as _np
+except ImportError:  # NumPy is optional; CSR filtering falls back to Python loops
+    _np = None
+
+# Enum .value goes through a descriptor on every access; resolving each member
+# once at import time turns the per-node/per-edge lookup into a plain dict hit.
+_NODE_TYPE_VALUES = {member: member.value for member in NodeType}
+_EDGE_TYPE_VALUES = {member: member.value for member in EdgeType}
+_CONFIDENCE_VALUES = {member: member.value for member in EdgeConfidence}
+
+# Numeric rank per confidence value, used for threshold comparisons.
+_CONFIDENCE_RANK = {
+    EdgeConfidence.HIGH.value: 3,
+    EdgeConfidence.MEDIUM.value: 2,
+    EdgeConfidence.LOW.value: 1,
+    EdgeConfidence.UNSAFE.value: 0,
+}
+_CONFIDENCE_MEMBER_RANK = {
+    member: _CONFIDENCE_RANK[member.value] for member in EdgeConfidence
+}
+
+# Below this many input graphs, merge_graphs skips the thread-pool staging
+# stage; pool startup would cost more than it overlaps.
+_PARALLEL_MERGE_MIN_GRAPHS = 4
+
+# Shared sentinel for nodes without parameters. Most nodes (files, classes,
+# variables) have none, so pointing them all at one list instead of a fresh
+# allocation per node saves real memory on large graphs. Callers treat node
+# attributes as read-only; never mutate this list.
+_NO_PARAMETERS: list[str] = []
+
+
+# Template for the generated per-NodeType node packers. Each NodeType gets a
+# specialized straight-line function with its type string baked in as a
+# constant, so the hot loop pays neither an enum-value lookup nor a branch.
+# Only static, trusted strings from this module reach exec.
+_NODE_PACKER_TEMPLATE = '''
+def _pack_{name}(node, _no_parameters=_NO_PARAMETERS, _intern=_intern):
+    return (
+        node.id,
+        {{
+            "type": {value!r},
+            "file_path": _intern(node.file_path),
+            "line_number": node.line_number,
+            "name": node.name,
+            "docstring": node.docstring,
+            "parameters": node.parameters or _no_parameters,
+            "return_type": node.return_type,
+        }},
+    )
+'''
+
+
+def _generate_node_packers() -> dict[NodeType, Callable[[GraphNode], tuple[str, dict]]]:
+    """Generate one specialized node-packing function per NodeType."""
+    packers = {}
+    for member in NodeType:
+        name = member.name.lower()
+        namespace = {"_NO_PARAMETERS": _NO_PARAMETERS, "_intern": intern}
+        exec(  # noqa: S102 - static template, no external input
+            _NODE_PACKER_TEMPLATE.format(name=name, value=member.value), namespace
+        )
+        packers[member] = namespace[f"_pack_{name}"]
+    return packers
+
+
+_NODE_PACKERS = _generate_node_packers()
+
+
+def _pack_edge(
+    edge: GraphEdge,
+    _edge_type_values=_EDGE_TYPE_VALUES,
+    _confidence_values=_CONFIDENCE_VALUES,
+    _member_rank=_CONFIDENCE_MEMBER_RANK,
+) -> tuple[str, str, dict]:
+    """Pack a GraphEdge into a (u, v, attrs) triple for insertion."""
+    confidence = edge.confidence
+    return (
+        edge.from_node,
+        edge.to_node,
+        {
+            "edge_type": _edge_type_values[edge.edge_type],
+            "confidence": _confidence_values[confidence],
+            # Pre-ranked copy of "confidence" so filtering compares ints
+            # instead of hashing strings per edge.
+            "_conf_rank": _member_rank[confidence],
+            "line_number": edge.line_number,
+            "label": edge.label,
+        },
+    )
+
+
+def _as_column(column, length: int, fill=None) -> list:
+    """Normalize an attribute column to a plain list of the given length.
+
+    NumPy arrays are converted via their C-level ``tolist()`` (duck-typed,
+    so NumPy never becomes a hard dependency); other sequences pass
+    through; ``None`` expands to a column of ``fill``.
+    """
+    if column is None:
+        return [fill] * length
+    tolist = getattr(column, "tolist", None)
+    if tolist is not None:
+        return tolist()
+    return list(column)
+
+
+@dataclass(slots=True, frozen=True)
+class CSRGraph:
+    """Compressed-sparse-row adjacency with per-edge confidence ranks.
+
+    Compact alternative to the dict-of-dicts DiGraph for confidence
+    filtering on very large graphs: the per-edge ranks live in one
+    contiguous signed-byte buffer, so a threshold filter is a single
+    vectorized compare when NumPy is available instead of a Python-level
+    dict walk per edge.
+    """
+
+    node_ids: list[str]  # row/column index -> node ID
+    indptr: array  # int64, len(node_ids) + 1
+    indices: array  # int64 column index per edge, grouped by source row
+    conf_rank: array  # int8 confidence rank per edge, same order as indices
+
+    def edges_at_or_above(self, min_confidence: str) -> list[tuple[str, str]]:
+        """Return (from_id, to_id) pairs at or above the confidence threshold.
+
+        Args:
+            min_confidence: Minimum confidence level ("high", "medium", "low", "unsafe").
+
+        Returns:
+            List of surviving edges as node-ID pairs.
+        """
+        min_level = _CONFIDENCE_RANK.get(min_confidence, 0)
+        ids = self.node_ids
+
+        if _np is not None:
+            ranks = _np.frombuffer(self.conf_rank, dtype=_np.int8)
+            mask = ranks >= min_level
+            if not mask.any():
+                return []
+            indptr = _np.frombuffer(self.indptr, dtype=_np.int64)
+            sources = _np.repeat(_np.arange(len(ids)), _np.diff(indptr))
+            columns = _np.frombuffer(self.indices, dtype=_np.int64)
+            return [
+                (ids[u], ids[v])
+                for u, v in zip(
+                    sources[mask].tolist(), columns[mask].tolist(), strict=True
+                )
+            ]
+
+        indptr = self.indptr
+        indices = self.indices
+        ranks = self.conf_rank
+        survivors: list[tuple[str, str]] = []
+        for row in range(len(ids)):
+            for pos in range(indptr[row], indptr[row + 1]):
+                if ranks[pos] >= min_level:
+                    survivors.append((ids[row], ids[indices[pos]]))
+        return survivors
 
 
 class GraphBuilder:
-    """Build and manage NetworkX dependency graph."""
+    """Build and manage NetworkX dependency graph.
+
+    The class holds no state - all methods are static and the packers live
+    at module level - so __slots__ is empty and instances carry no dict.
+    Module-level aliases below let callers skip the class entirely.
+    """
 
-    def build(self, nodes: list[GraphNode], edges: list[GraphEdge]) -> nx.DiGraph:
+    __slots__ = ()
+
+    @staticmethod
+    def build(nodes: list[GraphNode], edges: list[GraphEdge]) -> nx.DiGraph:
         """Build a NetworkX directed graph from nodes and edges.
 
         Args:
@@ -18,35 +194,226 @@ class GraphBuilder:
         Returns:
             NetworkX DiGraph with all nodes and edges.
         """
-        G: nx.DiGraph = nx.DiGraph()
+        G: nx.DiGraph = CachedDiGraph()
+
+        # Batch insertion: building the payloads up front and calling
+        # add_nodes_from/add_edges_from once is markedly faster than per-item
+        # add_node/add_edge calls when ingesting thousands of AST-derived
+        # nodes. GraphNode/GraphEdge are slotted dataclasses, so plain
+        # attribute access is already a raw slot read.
+        packers = _NODE_PACKERS
+        G.add_nodes_from(packers[node.type](node) for node in nodes)
 
-        # Add nodes with attributes
+        edge_payload = [_pack_edge(edge) for edge in edges]
+        G.add_edges_from(edge_payload)
+
+        # Confidence-to-edges index. filter_by_confidence uses it to touch
+        # only the surviving edges (O(k)) instead of testing every edge in
+        # the graph (O(E)). It lives in __networkx_cache__ - which NetworkX
+        # clears on every mutation method - so a graph edited after build()
+        # drops the index and filtering falls back to the full edge scan
+        # instead of silently missing the new edges.
+        by_conf: dict[str, list[tuple[str, str]]] = {
+            value: [] for value in _CONFIDENCE_VALUES.values()
+        }
+        for from_node, to_node, attrs in edge_payload:
+            by_conf[attrs["confidence"]].append((from_node, to_node))
+        G.__networkx_cache__["_by_conf"] = by_conf
+
+        return G
+
+    @staticmethod
+    def build_unchecked(nodes: list[GraphNode], edges: list[GraphEdge]) -> nx.DiGraph:
+        """Build a graph from prevalidated nodes and edges.
+
+        Fast path that writes node and edge rows straight into the internal
+        dicts, skipping the exists-or-update bookkeeping that add_node and
+        add_edge perform per item. Only the successor adjacency is written;
+        the predecessor index is derived lazily on first use, halving the
+        dict writes per edge for successor-only consumers.
+
+        Precondition (not checked): node IDs are unique. Edge endpoints
+        missing from ``nodes`` are added as bare attribute-less nodes, the
+        same as ``add_edges_from`` - parser output routinely references
+        targets with no node in the same file (imported modules, qualified
+        call names). Use :meth:`build` for input that may contain duplicate
+        node IDs.
+
+        Args:
+            nodes: List of GraphNode objects with unique IDs.
+            edges: List of GraphEdge objects between those nodes.
+
+        Returns:
+            NetworkX DiGraph with all nodes and edges.
+        """
+        G = LazyPredDiGraph()
+        node_dict = G._node
+        adj = G._adj
+
+        packers = _NODE_PACKERS
         for node in nodes:
-            G.add_node(
-                node.id,
-                type=node.type.value,
-                file_path=node.file_path,
-                line_number=node.line_number,
-                name=node.name,
-                docstring=node.docstring,
-                parameters=node.parameters,
-                return_type=node.return_type,
-            )
+            node_id, attrs = packers[node.type](node)
+            node_dict[node_id] = attrs
+            adj[node_id] = {}
+
+        by_conf: dict[str, list[tuple[str, str]]] = {
+            value: [] for value in _CONFIDENCE_VALUES.values()
+        }
+        for edge in edges:
+            from_node, to_node, attrs = _pack_edge(edge)
+            nbrs = adj.get(from_node)
+            if nbrs is None:
+                node_dict[from_node] = {}
+                nbrs = adj[from_node] = {}
+            if to_node not in adj:
+                node_dict[to_node] = {}
+                adj[to_node] = {}
+            nbrs[to_node] = attrs
+            by_conf[attrs["confidence"]].append((from_node, to_node))
+
+        G.__networkx_cache__["_by_conf"] = by_conf
+        # Successors only were written; derive the predecessor index from
+        # the adjacency if and when a consumer asks for it.
+        G._defer_pred()
+        return G
+
+    @staticmethod
+    def build_csr(nodes: list[GraphNode], edges: list[GraphEdge]) -> CSRGraph:
+        """Build a CSR adjacency from nodes and edges.
+
+        Node order follows ``nodes``; endpoints referenced only by edges are
+        appended, mirroring build(). Attribute data beyond the confidence
+        rank is not carried - build a DiGraph if attributes are needed.
+
+        Args:
+            nodes: List of GraphNode objects.
+            edges: List of GraphEdge objects.
+
+        Returns:
+            CSRGraph over the same nodes and edges.
+        """
+        index: dict[str, int] = {}
+        node_ids: list[str] = []
+
+        def row_for(node_id: str) -> int:
+            row = index.get(node_id)
+            if row is None:
+                row = len(node_ids)
+                index[node_id] = row
+                node_ids.append(node_id)
+            return row
+
+        for node in nodes:
+            row_for(node.id)
+        for edge in edges:
+            row_for(edge.from_node)
+            row_for(edge.to_node)
 
-        # Add edges with attributes
+        node_count = len(node_ids)
+        edge_count = len(edges)
+
+        out_degree = [0] * node_count
+        for edge in edges:
+            out_degree[index[edge.from_node]] += 1
+
+        indptr = array("q", bytes(8 * (node_count + 1)))
+        for row in range(node_count):
+            indptr[row + 1] = indptr[row] + out_degree[row]
+
+        cursor = indptr.tolist()
+        indices = array("q", bytes(8 * edge_count))
+        conf_rank = array("b", bytes(edge_count))
         for edge in edges:
-            G.add_edge(
-                edge.from_node,
-                edge.to_node,
-                edge_type=edge.edge_type.value,
-                confidence=edge.confidence.value,
-                line_number=edge.line_number,
-                label=edge.label,
+            row = index[edge.from_node]
+            pos = cursor[row]
+            cursor[row] = pos + 1
+            indices[pos] = index[edge.to_node]
+            conf_rank[pos] = _CONFIDENCE_MEMBER_RANK[edge.confidence]
+
+        return CSRGraph(
+            node_ids=node_ids, indptr=indptr, indices=indices, conf_rank=conf_rank
+        )
+
+    @staticmethod
+    def build_from_arrays(
+        ids,
+        types,
+        file_paths,
+        line_numbers,
+        names,
+        docstrings=None,
+        parameters=None,
+        return_types=None,
+    ) -> nx.DiGraph:
+        """Build a graph from parallel node-attribute columns.
+
+        Column-oriented (structure-of-arrays) fast path for bulk ingest:
+        callers that already hold node data as parallel arrays - e.g. NumPy
+        object columns decoded from a cache file - skip materializing a
+        GraphNode per row. ``types`` may hold NodeType members or their
+        string values. Every provided column must be the same length as
+        ``ids``; a mismatch raises ValueError rather than silently
+        truncating to the shortest column.
+
+        Args:
+            ids: Column of node IDs.
+            types: Column of node types (NodeType or str).
+            file_paths: Column of file paths.
+            line_numbers: Column of line numbers.
+            names: Column of symbol names.
+            docstrings: Optional column of docstrings.
+            parameters: Optional column of parameter lists.
+            return_types: Optional column of return types.
+
+        Returns:
+            NetworkX DiGraph with all nodes and no edges.
+        """
+        count = len(ids)
+        columns = zip(
+            _as_column(ids, count),
+            _as_column(types, count),
+            _as_column(file_paths, count),
+            _as_column(line_numbers, count),
+            _as_column(names, count),
+            _as_column(docstrings, count),
+            _as_column(parameters, count),
+            _as_column(return_types, count),
+            strict=True,
+        )
+
+        G: nx.DiGraph = CachedDiGraph()
+        G.add_nodes_from(
+            (
+                node_id,
+                {
+                    "type": _NODE_TYPE_VALUES.get(node_type, node_type),
+                    "file_path": intern(file_path),
+                    "line_number": line_number,
+                    "name": name,
+                    "docstring": docstring,
+                    "parameters": params or _NO_PARAMETERS,
+                    "return_type": return_type,
+                },
             )
+            for (
+                node_id,
+                node_type,
+                file_path,
+                line_number,
+                name,
+                docstring,
+                params,
+                return_type,
+            ) in columns
+        )
+        G.__networkx_cache__["_by_conf"] = {
+            value: [] for value in _CONFIDENCE_VALUES.values()
+        }
 
         return G
 
-    def merge_graphs(self, graphs: list[nx.DiGraph]) -> nx.DiGraph:
+    @staticmethod
+    def merge_graphs(graphs: list[nx.DiGraph]) -> nx.DiGraph:
         """Merge multiple graphs into one.
 
         Args:
@@ -55,24 +422,69 @@ class GraphBuilder:
         Returns:
             Merged NetworkX DiGraph.
         """
-        merged: nx.DiGraph = nx.DiGraph()
+        merged: nx.DiGraph = CachedDiGraph()
+
+        # Write into the internal dicts directly via C-level dict and set
+        # operations rather than looping edges in Python with per-item
+        # membership probes.
+        merged_node = merged._node
+        merged_adj = merged._adj
+        merged_pred = merged._pred
+
+        # For many input graphs (one per analysed module in CI ingest),
+        # snapshot each graph's row dicts up front so the combine below
+        # walks stable dicts. The C-level dict copies hold the GIL, so the
+        # pool overlaps little actual work; the threshold mainly keeps pool
+        # startup off the common two-graph path.
+        if len(graphs) >= _PARALLEL_MERGE_MIN_GRAPHS:
+            with ThreadPoolExecutor() as executor:
+                staged = list(
+                    executor.map(lambda g: (dict(g._node), dict(g._adj)), graphs)
+                )
+        else:
+            staged = [(G._node, G._adj) for G in graphs]
 
-        for G in graphs:
-            # Add all nodes
-            for node_id, attrs in G.nodes(data=True):
-                if node_id not in merged:
-                    merged.add_node(node_id, **attrs)
+        # Nodes: update() is last-writer-wins, so walking in reverse makes
+        # the first graph's attributes win on collision.
+        for node_rows, _ in reversed(staged):
+            merged_node.update(node_rows)
+        for node_id in merged_node:
+            merged_adj[node_id] = {}
+            merged_pred[node_id] = {}
 
-            # Add all edges
-            for from_node, to_node, attrs in G.edges(data=True):
-                if not merged.has_edge(from_node, to_node):
-                    merged.add_edge(from_node, to_node, **attrs)
+        # Edges, first-wins via set operations: per source row, the edges a
+        # graph can still contribute are its neighbour keys minus those
+        # already merged - one C-level set difference on the dict key views
+        # replaces a membership probe per edge.
+        for _, adj_rows in staged:
+            for from_node, nbrs in adj_rows.items():
+                dest = merged_adj[from_node]
+                if not dest:
+                    dest.update(nbrs)
+                    new_targets = nbrs
+                else:
+                    new_targets = nbrs.keys() - dest.keys()
+                    for to_node in new_targets:
+                        dest[to_node] = nbrs[to_node]
+                for to_node in new_targets:
+                    merged_pred[to_node][from_node] = dest[to_node]
 
+        # Rebuild the confidence index for the merged graph in one pass, so
+        # filter_by_confidence stays on its indexed fast path downstream.
+        by_conf: dict[str, list[tuple[str, str]]] = {
+            value: [] for value in _CONFIDENCE_VALUES.values()
+        }
+        for from_node, nbrs in merged_adj.items():
+            for to_node, attrs in nbrs.items():
+                by_conf.setdefault(attrs.get("confidence", "medium"), []).append(
+                    (from_node, to_node)
+                )
+
+        merged.__networkx_cache__["_by_conf"] = by_conf
         return merged
 
-    def filter_by_confidence(
-        self, G: nx.DiGraph, min_confidence: str
-    ) -> nx.DiGraph:
+    @staticmethod
+    def filter_by_confidence(G: nx.DiGraph, min_confidence: str) -> nx.DiGraph:
         """Filter graph to only include edges at or above a confidence level.
 
         Args:
@@ -80,20 +492,58 @@ class GraphBuilder:
             min_confidence: Minimum confidence level ("high", "medium", "low", "unsafe").
 
         Returns:
-            Filtered NetworkX DiGraph.
+            Read-only NetworkX view of G containing all nodes and only the
+            edges at or above the threshold. Call .copy() on the result if
+            an independent mutable graph is needed.
         """
-        confidence_order = {"high": 3, "medium": 2, "low": 1, "unsafe": 0}
-        min_level = confidence_order.get(min_confidence, 0)
+        min_level = _CONFIDENCE_RANK.get(min_confidence, 0)
+        adj = G._adj
+        rank = _CONFIDENCE_RANK
+
+        # A subgraph view costs O(1) to construct and copies no node or edge
+        # data; only edges that survive the predicate are ever materialized.
+        def keep(from_node: str, to_node: str) -> bool:
+            data = adj[from_node][to_node]
+            # Graphs built by GraphBuilder carry a pre-ranked int; fall back
+            # to the string attribute for graphs built elsewhere.
+            level = data.get("_conf_rank")
+            if level is None:
+                level = rank.get(data.get("confidence", "medium"), 0)
+            return level >= min_level
+
+        cache = getattr(G, "__networkx_cache__", None)
+        by_conf = cache.get("_by_conf") if cache is not None else None
+        if by_conf is not None:
+            # Indexed fast path: graphs produced by this builder carry a
+            # confidence -> edge-list index in __networkx_cache__, so the
+            # surviving edge set is precomputed in O(k) and the view answers
+            # each edge query with a single set probe. Nothing is copied;
+            # nodes, edges and their attribute dicts all proxy to G.
+            allowed = {
+                pair
+                for confidence, pairs in by_conf.items()
+                if rank.get(confidence, 0) >= min_level
+                for pair in pairs
+            }
+
+            def keep_indexed(from_node: str, to_node: str) -> bool:
+                # Subgraph views are live, so the snapshot is only valid
+                # while the index it came from is. NetworkX clears the
+                # cache on any mutation of G; once the entry this set was
+                # derived from is gone, judge from the live attributes.
+                if cache.get("_by_conf") is by_conf:
+                    return (from_node, to_node) in allowed
+                return keep(from_node, to_node)
 
-        filtered: nx.DiGraph = nx.DiGraph()
+            return nx.subgraph_view(G, filter_edge=keep_indexed)
 
-        # Copy all nodes
-        filtered.add_nodes_from(G.nodes(data=True))
+        return nx.subgraph_view(G, filter_edge=keep)
 
-        # Copy only edges meeting confidence threshold
-        for from_node, to_node, attrs in G.edges(data=True):
-            edge_confidence = attrs.get("confidence", "medium")
-            if confidence_order.get(edge_confidence, 0) >= min_level:
-                filtered.add_edge(from_node, to_node, **attrs)
 
-        return filtered
+# Module-level entry points for callers that do not need the class.
+build = GraphBuilder.build
+build_unchecked = GraphBuilder.build_unchecked
+build_csr = GraphBuilder.build_csr
+build_from_arrays = GraphBuilder.build_from_arrays
+merge_graphs = GraphBuilder.merge_graphs
+filter_by_confidence = GraphBuilder.filter_by_confidence
@@ -0,0 +1,131 @@
+"""DiGraph subclasses with cached or lazily built internals."""
+
+from functools import cached_property
+
+import networkx as nx
+from networkx.classes.reportviews import OutEdgeView
+
+
+class _CachedOutEdgeView(OutEdgeView):
+    """OutEdgeView whose len() delegates to the graph's cached edge count."""
+
+    __slots__ = ()
+
+    def __len__(self) -> int:
+        return self._graph.number_of_edges()
+
+
+class CachedDiGraph(nx.DiGraph):
+    """DiGraph that caches its edge count in ``__networkx_cache__``.
+
+    NetworkX answers ``len(G.edges)`` / ``number_of_edges()`` by summing the
+    successor-dict size of every node, which is O(N) per call. Dependency
+    graphs are queried for their size far more often than they are mutated,
+    so the count is computed once and stored in ``__networkx_cache__`` - the
+    cache NetworkX itself clears on every mutation method, which keeps the
+    stored count consistent without any bookkeeping here.
+
+    Code that writes into the internal adjacency dicts directly (bypassing
+    the mutation methods) must do so before the first count query, or clear
+    ``__networkx_cache__`` itself.
+    """
+
+    def number_of_edges(self, u=None, v=None) -> int:
+        if u is not None:
+            return super().number_of_edges(u, v)
+        if hasattr(self, "_graph"):
+            # Subgraph views instantiate this class but proxy their rows to
+            # a base graph, and mutating the base never clears the view's
+            # own cache - a cached count would go stale. Count live.
+            return sum(map(len, self._adj.values()))
+        cache = self.__networkx_cache__
+        count = cache.get("number_of_edges")
+        if count is None:
+            # Sum the successor rows directly rather than deferring to
+            # size(): the degree view behind size() reads _pred, which
+            # would force LazyPredDiGraph to materialize its predecessor
+            # index just to answer a count.
+            count = sum(map(len, self._adj.values()))
+            cache["number_of_edges"] = count
+        return count
+
+    def size(self, weight=None):
+        if weight is None:
+            return self.number_of_edges()
+        return super().size(weight)
+
+    @cached_property
+    def edges(self):
+        return _CachedOutEdgeView(self)
+
+    # DiGraph exposes out_edges as the same kind of view as edges.
+    @cached_property
+    def out_edges(self):
+        return _CachedOutEdgeView(self)
+
+
+class LazyPredDiGraph(CachedDiGraph):
+    """DiGraph whose predecessor index can be built on first use.
+
+    Maintaining ``_pred`` doubles the dict writes of every edge insertion,
+    but consumers that only walk successors never read it. Bulk builders can
+    fill ``_adj`` alone and call :meth:`_defer_pred`; the predecessor index
+    is then derived from the adjacency the first time anything asks for it
+    (``predecessors``, ``in_edges``, reverse traversals, ...).
+
+    Graphs mutated through the normal NetworkX methods behave exactly like
+    a DiGraph - ``_pred`` is kept up to date once it exists.
+    """
+
+    @property
+    def _pred(self):
+        pred = self.__dict__.get("_lazy_pred")
+        if pred is None:
+            adj = self._adj
+            pred = {node: {} for node in adj}
+            for from_node, nbrs in adj.items():
+                for to_node, attrs in nbrs.items():
+                    pred[to_node][from_node] = attrs
+            self.__dict__["_lazy_pred"] = pred
+        return pred
+
+    @_pred.setter
+    def _pred(self, value) -> None:
+        self.__dict__["_lazy_pred"] = value
+
+    def _materialize_pred(self) -> None:
+        """Force the predecessor index into existence before a removal.
+
+        The DiGraph removal methods delete from the successor rows before
+        touching ``_pred``; deriving the index mid-removal would build it
+        from the already-mutated adjacency and miss the edge being removed.
+        """
+        _ = self._pred
+
+    def remove_node(self, n) -> None:
+        self._materialize_pred()
+        super().remove_node(n)
+
+    def remove_nodes_from(self, nodes) -> None:
+        self._materialize_pred()
+        super().remove_nodes_from(nodes)
+
+    def remove_edge(self, u, v) -> None:
+        self._materialize_pred()
+        super().remove_edge(u, v)
+
+    def remove_edges_from(self, ebunch) -> None:
+        self._materialize_pred()
+        super().remove_edges_from(ebunch)
+
+    def clear_edges(self) -> None:
+        self._materialize_pred()
+        super().clear_edges()
+
+    def _defer_pred(self) -> None:
+        """Discard the predecessor index; rebuild from _adj on next access.
+
+        Only for builders that populate ``_adj`` directly and never touched
+        ``_pred`` - any writes made to it so far are dropped.
+        """
+        self.__dict__["_lazy_pred"] = None
@@ -4,6 +4,8 @@ These models mirror the TypeScript types in src/services/dag/types.ts
 to ensure consistent data structures across the extension and engine.
 """
 
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
@@ -39,23 +41,50 @@ class EdgeType(str, Enum):
     REFERENCE = "reference"
 
 
-class GraphNode(BaseModel):
-    """A node in the dependency graph representing a code symbol."""
+@dataclass(slots=True, frozen=True)
+class GraphNode:
+    """A node in the dependency graph representing a code symbol.
 
-    id: str = Field(description="Unique identifier (format: file_path:symbol_name)")
+    Graphs are built from hundreds of thousands of these, so they are plain
+    slotted dataclasses rather than Pydantic models: no per-field validation
+    on construction and no per-instance dict. Untrusted input should come in
+    through :meth:`from_raw`.
+    """
+
+    id: str  # Unique identifier (format: file_path:symbol_name)
     type: NodeType
     file_path: str
     line_number: int
     name: str
     docstring: str | None = None
-    parameters: list[str] = Field(default_factory=list)
+    parameters: list[str] = field(default_factory=list)
     return_type: str | None = None
     column_number: int | None = None
     end_line_number: int | None = None
 
-
-class GraphEdge(BaseModel):
-    """An edge in the dependency graph representing a relationship."""
+    @classmethod
+    def from_raw(cls, data: Mapping[str, Any]) -> "GraphNode":
+        """Validate and build a node from an untrusted mapping."""
+        return cls(
+            id=str(data["id"]),
+            type=NodeType(data["type"]),
+            file_path=str(data["file_path"]),
+            line_number=int(data["line_number"]),
+            name=str(data["name"]),
+            docstring=data.get("docstring"),
+            parameters=list(data.get("parameters") or []),
+            return_type=data.get("return_type"),
+            column_number=data.get("column_number"),
+            end_line_number=data.get("end_line_number"),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class GraphEdge:
+    """An edge in the dependency graph representing a relationship.
+
+    Slotted dataclass for the same hot-path reasons as :class:`GraphNode`.
+    """
 
     from_node: str
     to_node: str
@@ -65,6 +94,19 @@ class GraphEdge(BaseModel):
     label: str
     context: str | None = None
 
+    @classmethod
+    def from_raw(cls, data: Mapping[str, Any]) -> "GraphEdge":
+        """Validate and build an edge from an untrusted mapping."""
+        return cls(
+            from_node=str(data["from_node"]),
+            to_node=str(data["to_node"]),
+            edge_type=EdgeType(data["edge_type"]),
+            confidence=EdgeConfidence(data["confidence"]),
+            line_number=int(data["line_number"]),
+            label=str(data["label"]),
+            context=data.get("context"),
+        )
+
 
 class AnalysisWarning(BaseModel):
     """Warning generated during analysis."""
@@ -7,6 +7,7 @@ accepting JSON-RPC 2.0 requests and returning responses.
 import json
 import os
 import sys
+from dataclasses import asdict
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -268,7 +269,7 @@ class DAGServer:
                 continue
             if node_type and node.type.value != node_type:
                 continue
-            matches.append(node.model_dump())
+            matches.append(asdict(node))
             if len(matches) >= limit:
                 break
 
@@ -285,10 +286,10 @@ class DAGServer:
             return {"incoming": [], "outgoing": []}
 
         incoming = [
-            e.model_dump() for e in cached.edges if e.to_node == node_id
+            asdict(e) for e in cached.edges if e.to_node == node_id
         ]
         outgoing = [
-            e.model_dump() for e in cached.edges if e.from_node == node_id
+            asdict(e) for e in cached.edges if e.from_node == node_id
         ]
 
         return {"incoming": incoming, "outgoing": outgoing}
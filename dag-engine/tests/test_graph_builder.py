@@ -1,5 +1,7 @@
 """Tests for the GraphBuilder."""
 
+from collections import Counter
+
 import networkx as nx
 
 from beadsmith_dag.graph.builder import GraphBuilder
@@ -112,6 +114,225 @@ class TestGraphBuilder:
         assert edge_attrs["line_number"] == 12
         assert edge_attrs["label"] == "calls greet()"
 
+    def test_build_unchecked_matches_build(self) -> None:
+        """Test that build_unchecked() produces the same graph as build()."""
+        builder = GraphBuilder()
+
+        nodes = [
+            GraphNode(
+                id="function:test.py:main",
+                type=NodeType.FUNCTION,
+                file_path="test.py",
+                line_number=10,
+                name="main",
+            ),
+            GraphNode(
+                id="function:test.py:greet",
+                type=NodeType.FUNCTION,
+                file_path="test.py",
+                line_number=5,
+                name="greet",
+                parameters=["name"],
+            ),
+        ]
+        edges = [
+            GraphEdge(
+                from_node="function:test.py:main",
+                to_node="function:test.py:greet",
+                edge_type=EdgeType.CALL,
+                confidence=EdgeConfidence.HIGH,
+                line_number=12,
+                label="calls greet()",
+            ),
+            # Parser output targets imported modules that have no node in
+            # the same file; both paths must add the bare endpoint
+            GraphEdge(
+                from_node="function:test.py:main",
+                to_node="os",
+                edge_type=EdgeType.IMPORT,
+                confidence=EdgeConfidence.HIGH,
+                line_number=1,
+                label="import os",
+            ),
+        ]
+
+        checked = builder.build(nodes, edges)
+        unchecked = builder.build_unchecked(nodes, edges)
+
+        assert set(unchecked.nodes) == set(checked.nodes)
+        assert set(unchecked.edges) == set(checked.edges)
+        for node_id in checked.nodes:
+            assert unchecked.nodes[node_id] == checked.nodes[node_id]
+        for u, v in checked.edges:
+            assert unchecked.edges[u, v] == checked.edges[u, v]
+        # Size queries answer from the successor rows alone and must not
+        # force the predecessor index
+        assert unchecked.number_of_edges() == checked.number_of_edges()
+        assert len(unchecked.edges) == len(checked.edges)
+        # The predecessor index is deferred until something asks for it,
+        # then must answer reverse traversals correctly
+        assert unchecked.__dict__["_lazy_pred"] is None
+        assert list(unchecked.predecessors("function:test.py:greet")) == [
+            "function:test.py:main"
+        ]
+        assert unchecked.__dict__["_lazy_pred"] is not None
+
+    def test_build_unchecked_removes_edges_before_pred_is_read(self) -> None:
+        """Test that edge removal works before the predecessor index exists."""
+        builder = GraphBuilder()
+
+        nodes = [
+            GraphNode(
+                id="node1",
+                type=NodeType.FUNCTION,
+                file_path="test.py",
+                line_number=1,
+                name="node1",
+            ),
+            GraphNode(
+                id="node2",
+                type=NodeType.FUNCTION,
+                file_path="test.py",
+                line_number=2,
+                name="node2",
+            ),
+            GraphNode(
+                id="node3",
+                type=NodeType.FUNCTION,
+                file_path="test.py",
+                line_number=3,
+                name="node3",
+            ),
+        ]
+        edges = [
+            GraphEdge(
+                from_node="node1",
+                to_node="node2",
+                edge_type=EdgeType.CALL,
+                confidence=EdgeConfidence.HIGH,
+                line_number=0,
+                label="test",
+            ),
+            GraphEdge(
+                from_node="node1",
+                to_node="node3",
+                edge_type=EdgeType.CALL,
+                confidence=EdgeConfidence.HIGH,
+                line_number=0,
+                label="test",
+            ),
+        ]
+
+        graph = builder.build_unchecked(nodes, edges)
+
+        # Removal must not derive the predecessor index from rows the
+        # removal has already mutated
+        assert graph.__dict__["_lazy_pred"] is None
+        graph.remove_edge("node1", "node2")
+        graph.remove_edges_from([("node1", "node3")])
+
+        assert len(graph.edges) == 0
+        assert list(graph.predecessors("node2")) == []
+        assert list(graph.predecessors("node3")) == []
+
+    def test_build_csr_filters_by_confidence(self) -> None:
+        """Test that the CSR representation filters edges like the graph path."""
+        builder = GraphBuilder()
+
+        nodes = [
+            GraphNode(
+                id="node1",
+                type=NodeType.FUNCTION,
+                file_path="test.py",
+                line_number=1,
+                name="node1",
+            ),
+            GraphNode(
+                id="node2",
+                type=NodeType.FUNCTION,
+                file_path="test.py",
+                line_number=2,
+                name="node2",
+            ),
+            GraphNode(
+                id="node3",
+                type=NodeType.FUNCTION,
+                file_path="test.py",
+                line_number=3,
+                name="node3",
+            ),
+        ]
+        edges = [
+            GraphEdge(
+                from_node="node1",
+                to_node="node2",
+                edge_type=EdgeType.CALL,
+                confidence=EdgeConfidence.HIGH,
+                line_number=0,
+                label="test",
+            ),
+            GraphEdge(
+                from_node="node1",
+                to_node="node3",
+                edge_type=EdgeType.CALL,
+                confidence=EdgeConfidence.LOW,
+                line_number=0,
+                label="test",
+            ),
+            GraphEdge(
+                from_node="node2",
+                to_node="node3",
+                edge_type=EdgeType.CALL,
+                confidence=EdgeConfidence.MEDIUM,
+                line_number=0,
+                label="test",
+            ),
+        ]
+
+        csr = builder.build_csr(nodes, edges)
+
+        assert csr.node_ids == ["node1", "node2", "node3"]
+        assert sorted(csr.edges_at_or_above("medium")) == [
+            ("node1", "node2"),
+            ("node2", "node3"),
+        ]
+        assert sorted(csr.edges_at_or_above("unsafe")) == [
+            ("node1", "node2"),
+            ("node1", "node3"),
+            ("node2", "node3"),
+        ]
+        assert csr.edges_at_or_above("high") == [("node1", "node2")]
+
+    def test_build_from_arrays_writes_node_attributes(self) -> None:
+        """Test that build_from_arrays() populates nodes from parallel columns."""
+        builder = GraphBuilder()
+
+        graph = builder.build_from_arrays(
+            ids=["file:test.py", "function:test.py:greet"],
+            types=[NodeType.FILE, NodeType.FUNCTION.value],
+            file_paths=["test.py", "test.py"],
+            line_numbers=[0, 5],
+            names=["test.py", "greet"],
+            parameters=[None, ["name"]],
+            return_types=[None, "str"],
+        )
+
+        assert len(graph.nodes) == 2
+
+        func_attrs = graph.nodes["function:test.py:greet"]
+        assert func_attrs["type"] == NodeType.FUNCTION.value
+        assert func_attrs["file_path"] == "test.py"
+        assert func_attrs["line_number"] == 5
+        assert func_attrs["name"] == "greet"
+        assert func_attrs["docstring"] is None
+        assert func_attrs["parameters"] == ["name"]
+        assert func_attrs["return_type"] == "str"
+
+        # Omitted optional columns default sensibly
+        file_attrs = graph.nodes["file:test.py"]
+        assert file_attrs["parameters"] == []
+        assert file_attrs["return_type"] is None
+
     def test_merge_graphs_preserves_attributes(self) -> None:
         """Test that merge_graphs() preserves node and edge attributes."""
         builder = GraphBuilder()
@@ -249,6 +470,77 @@ class TestGraphBuilder:
         assert edge_attrs["label"] == "first call"
         assert edge_attrs["confidence"] == EdgeConfidence.HIGH.value
 
+    def test_merge_many_graphs_handles_collisions(self) -> None:
+        """Test that merging four graphs keeps first-wins collision handling.
+
+        Four inputs cross the thread-pool staging threshold, so this
+        exercises the snapshot branch of merge_graphs that the two-graph
+        tests never reach.
+        """
+        builder = GraphBuilder()
+
+        graphs = []
+        for version in range(4):
+            nodes = [
+                GraphNode(
+                    id="function:test.py:main",
+                    type=NodeType.FUNCTION,
+                    file_path="test.py",
+                    line_number=10,
+                    name="main",
+                    docstring=f"version {version}",
+                ),
+                GraphNode(
+                    id="function:test.py:greet",
+                    type=NodeType.FUNCTION,
+                    file_path="test.py",
+                    line_number=5,
+                    name="greet",
+                ),
+                GraphNode(
+                    id=f"file:module{version}.py",
+                    type=NodeType.FILE,
+                    file_path=f"module{version}.py",
+                    line_number=0,
+                    name=f"module{version}.py",
+                ),
+            ]
+            edges = [
+                GraphEdge(
+                    from_node="function:test.py:main",
+                    to_node="function:test.py:greet",
+                    edge_type=EdgeType.CALL,
+                    confidence=EdgeConfidence.HIGH,
+                    line_number=12,
+                    label=f"call {version}",
+                ),
+                GraphEdge(
+                    from_node="function:test.py:main",
+                    to_node=f"file:module{version}.py",
+                    edge_type=EdgeType.IMPORT,
+                    confidence=EdgeConfidence.MEDIUM,
+                    line_number=1,
+                    label=f"import module{version}",
+                ),
+            ]
+            graphs.append(builder.build(nodes, edges))
+
+        merged = builder.merge_graphs(graphs)
+
+        # Shared nodes collapse, unique nodes survive
+        assert len(merged.nodes) == 6
+        assert merged.nodes["function:test.py:main"]["docstring"] == "version 0"
+
+        # The colliding edge keeps the first graph's attributes; each
+        # graph's unique edge survives with working reverse traversal
+        assert len(merged.edges) == 5
+        edge_attrs = merged.edges["function:test.py:main", "function:test.py:greet"]
+        assert edge_attrs["label"] == "call 0"
+        for version in range(4):
+            node_id = f"file:module{version}.py"
+            assert merged.has_edge("function:test.py:main", node_id)
+            assert list(merged.predecessors(node_id)) == ["function:test.py:main"]
+
     def test_filter_by_confidence_high(self) -> None:
         """Test filter_by_confidence() correctly includes/excludes edges for high threshold."""
         builder = GraphBuilder()
@@ -317,11 +609,9 @@ class TestGraphBuilder:
         # All nodes should be present
         assert len(filtered.nodes) == 4
 
-        # Only high confidence edge should remain
-        assert len(filtered.edges) == 1
-        assert filtered.has_edge("node1", "node2")
-        assert not filtered.has_edge("node1", "node3")
-        assert not filtered.has_edge("node1", "node4")
+        # Only high confidence edge should remain. Counter comparison is a
+        # single pass and order-invariant, unlike per-edge has_edge probes.
+        assert Counter(list(filtered.edges())) == Counter([("node1", "node2")])
 
     def test_filter_by_confidence_medium(self) -> None:
         """Test filter_by_confidence() correctly includes edges at or above medium threshold."""
@@ -347,10 +637,9 @@ class TestGraphBuilder:
         assert len(filtered.nodes) == 4
 
         # High and medium confidence edges should remain
-        assert len(filtered.edges) == 2
-        assert filtered.has_edge("node1", "node2")
-        assert filtered.has_edge("node1", "node3")
-        assert not filtered.has_edge("node1", "node4")
+        assert Counter(list(filtered.edges())) == Counter(
+            [("node1", "node2"), ("node1", "node3")]
+        )
 
     def test_filter_by_confidence_low(self) -> None:
         """Test filter_by_confidence() includes all non-unsafe edges for low threshold."""
@@ -378,11 +667,9 @@ class TestGraphBuilder:
         assert len(filtered.nodes) == 5
 
         # All edges except unsafe should remain
-        assert len(filtered.edges) == 3
-        assert filtered.has_edge("node1", "node2")
-        assert filtered.has_edge("node1", "node3")
-        assert filtered.has_edge("node1", "node4")
-        assert not filtered.has_edge("node1", "node5")
+        assert Counter(list(filtered.edges())) == Counter(
+            [("node1", "node2"), ("node1", "node3"), ("node1", "node4")]
+        )
 
     def test_filter_by_confidence_unsafe(self) -> None:
         """Test filter_by_confidence() includes all edges for unsafe threshold."""
@@ -404,9 +691,96 @@ class TestGraphBuilder:
 
         # All nodes and edges should remain
         assert len(filtered.nodes) == 3
+        assert Counter(list(filtered.edges())) == Counter(
+            [("node1", "node2"), ("node1", "node3")]
+        )
+
+    def test_filter_view_tracks_base_graph_mutations(self) -> None:
+        """Test that an existing filtered view reflects later base-graph edits."""
+        builder = GraphBuilder()
+
+        nodes = [
+            GraphNode(
+                id="node1",
+                type=NodeType.FUNCTION,
+                file_path="test.py",
+                line_number=1,
+                name="node1",
+            ),
+            GraphNode(
+                id="node2",
+                type=NodeType.FUNCTION,
+                file_path="test.py",
+                line_number=2,
+                name="node2",
+            ),
+        ]
+        edges = [
+            GraphEdge(
+                from_node="node1",
+                to_node="node2",
+                edge_type=EdgeType.CALL,
+                confidence=EdgeConfidence.HIGH,
+                line_number=0,
+                label="test",
+            ),
+        ]
+
+        graph = builder.build(nodes, edges)
+        filtered = builder.filter_by_confidence(graph, "high")
+        assert len(filtered.edges) == 1
+
+        # Subgraph views are live: a qualifying edge added to the base
+        # graph after the view was created must show up, in the edge set
+        # and in the count alike
+        graph.add_edge("node2", "node1", confidence=EdgeConfidence.HIGH.value)
+
+        assert Counter(list(filtered.edges())) == Counter(
+            [("node1", "node2"), ("node2", "node1")]
+        )
         assert len(filtered.edges) == 2
-        assert filtered.has_edge("node1", "node2")
-        assert filtered.has_edge("node1", "node3")
+
+    def test_filter_by_confidence_after_mutation(self) -> None:
+        """Test that filtering reflects edges added after build()."""
+        builder = GraphBuilder()
+
+        nodes = [
+            GraphNode(
+                id="node1",
+                type=NodeType.FUNCTION,
+                file_path="test.py",
+                line_number=1,
+                name="node1",
+            ),
+            GraphNode(
+                id="node2",
+                type=NodeType.FUNCTION,
+                file_path="test.py",
+                line_number=2,
+                name="node2",
+            ),
+        ]
+        edges = [
+            GraphEdge(
+                from_node="node1",
+                to_node="node2",
+                edge_type=EdgeType.CALL,
+                confidence=EdgeConfidence.HIGH,
+                line_number=0,
+                label="test",
+            ),
+        ]
+
+        graph = builder.build(nodes, edges)
+        # Mutation drops the builder's confidence index, so filtering must
+        # fall back to scanning the live edges rather than answering from
+        # the stale index
+        graph.add_edge("node2", "node1", confidence=EdgeConfidence.HIGH.value)
+        filtered = builder.filter_by_confidence(graph, "high")
+
+        assert Counter(list(filtered.edges())) == Counter(
+            [("node1", "node2"), ("node2", "node1")]
+        )
 
     def test_empty_graph(self) -> None:
         """Test building an empty graph."""
@@ -3,6 +3,7 @@
 Exercises the full pipeline: parse files -> build graph -> query impact.
 """
 
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
@@ -38,7 +39,7 @@ def _resolve_edges(nodes: list[GraphNode], edges: list[GraphEdge]) -> list[Graph
         to_node = edge.to_node
         if to_node in file_stem_to_id:
             to_node = file_stem_to_id[to_node]
-        resolved.append(edge.model_copy(update={"to_node": to_node}))
+        resolved.append(replace(edge, to_node=to_node))
     return resolved
 
 